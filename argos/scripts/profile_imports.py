@@ -0,0 +1,83 @@
+# Script to profile the import (startup) cost of a module, per imported module.
+#
+# Usage (from project root):
+#     python argos/scripts/profile_imports.py api.app --top 25
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def profile_imports(module: str) -> List[Tuple[str, int, int]]:
+    """
+    Import module in a fresh interpreter with -X importtime and return
+    (module, self_us, cumulative_us) for every module it loaded.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT, env.get("PYTHONPATH")]))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=ROOT,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{proc.stderr}")
+
+    # importtime prints each module after its dependencies, indented by depth.
+    # Keep only the subtree ending at the top-level entry for `module`, which
+    # drops the interpreter's own startup imports (site, encodings, ...).
+    entries: List[Tuple[str, int, int]] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header line
+        raw_name = parts[2][1:]
+        is_top_level = not raw_name.startswith(" ")
+        entries.append((raw_name.strip(), int(parts[0]), int(parts[1])))
+        if is_top_level:
+            if raw_name == module:
+                return entries
+            entries = []
+    return entries
+
+
+def import_time_us(module: str) -> int:
+    """
+    Return the cumulative import time of module in microseconds.
+    """
+    cumulative: Dict[str, int] = {name: cum for name, _, cum in profile_imports(module)}
+    return cumulative[module]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report per-module import cost.")
+    parser.add_argument("module", nargs="?", default="api.app", help="Module to import (default: api.app)")
+    parser.add_argument("--top", type=int, default=20, help="Number of modules to show (default: 20)")
+    parser.add_argument(
+        "--sort",
+        choices=["self", "cumulative"],
+        default="self",
+        help="Sort by self or cumulative time (default: self)",
+    )
+    args = parser.parse_args()
+
+    entries = profile_imports(args.module)
+    key = 1 if args.sort == "self" else 2
+    total = next((cum for name, _, cum in entries if name == args.module), 0)
+
+    print(f"Import of {args.module}: {total / 1000:.1f} ms total, {len(entries)} modules")
+    print(f"{'self ms':>10} {'cumul ms':>10}  module")
+    for name, self_us, cum_us in sorted(entries, key=lambda e: e[key], reverse=True)[:args.top]:
+        print(f"{self_us / 1000:10.2f} {cum_us / 1000:10.2f}  {name}")
+
+
+if __name__ == "__main__":
+    main()
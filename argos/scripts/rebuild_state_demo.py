@@ -1,12 +1,63 @@
-# Demonstrates snapshot + replay for EnrollmentState and Timetable.
+# Demonstrates snapshot + replay for EnrollmentState.
+# Only the tail of the event log (events after the snapshot's high-water mark)
+# is replayed, so rebuild time grows with the events since the last snapshot.
+#
+# SnapshotStore does not record snapshots.last_event_id yet: snapshots it saves
+# get mark 0 and are followed by a full replay. The helpers below read and
+# write the mark directly until the store takes them over.
 
 import json
+from datetime import datetime
+
 from common.infrastructure.db.database import Database
 from common.infrastructure.db.schema_init import create_schema
-from common.infrastructure.event_store.sqlite_event_store import SQLiteEventStore
-from common.infrastructure.event_store.snapshot_store import SnapshotStore
+from data.migrations.m004_add_snapshot_last_event_id import AddSnapshotLastEventIdMigration
 from services.enrollment_service.app.service.enrollment_state import EnrollmentState
-from services.scheduler_service.app.service.timetable import Timetable
+
+SNAPSHOT_KEY = "ENROLLMENT_STATE"
+
+
+def load_snapshot(db, key):
+    """
+    Return (state_dict, last_event_id) for the snapshot stored under key,
+    or (None, 0) when no snapshot exists.
+    """
+    rows = db.query_all(
+        "SELECT data, last_event_id FROM snapshots WHERE key = ?",
+        (key,),
+    )
+    if not rows:
+        return None, 0
+    return json.loads(rows[0]["data"]), rows[0]["last_event_id"]
+
+
+def save_snapshot(db, key, state_dict, last_event_id):
+    """
+    Persist state_dict together with the id of the last event it covers.
+    """
+    db.execute(
+        "INSERT OR REPLACE INTO snapshots (key, data, timestamp, last_event_id) "
+        "VALUES (?, ?, ?, ?)",
+        (key, json.dumps(state_dict), datetime.utcnow().isoformat(), last_event_id),
+    )
+
+
+def iter_events_after(db, last_event_id, event_type, batch_size=1000):
+    """
+    Yield events of event_type appended after last_event_id, in log order.
+
+    Rows are fetched in keyset-paginated batches (id > last seen id), so
+    memory stays bounded by batch_size however long the log is.
+    """
+    while True:
+        rows = db.query_all(
+            "SELECT id, payload FROM events WHERE id > ? AND type = ? ORDER BY id LIMIT ?",
+            (last_event_id, event_type, batch_size),
+        )
+        if not rows:
+            return
+        yield from rows
+        last_event_id = rows[-1]["id"]
 
 
 def rebuild_enrollment_state(db_path="argos.db", section_id="SECTION-101"):
@@ -14,30 +65,34 @@ def rebuild_enrollment_state(db_path="argos.db", section_id="SECTION-101"):
 
     db = Database(db_path)
     create_schema(db)
-    event_store = SQLiteEventStore(db)
-    snapshot_store = SnapshotStore(db)
+    # The high-water mark column is added by m004; make sure it exists
+    AddSnapshotLastEventIdMigration().up(db)
 
     # Step 1: Try load snapshot
-    snapshot = snapshot_store.get_latest_snapshot(entity_id="ENROLLMENT_STATE")
+    snapshot, last_event_id = load_snapshot(db, SNAPSHOT_KEY)
     state = EnrollmentState()
 
-    if snapshot:
-        print("✔ Found snapshot, applying...")
-        state.apply_snapshot_dict(json.loads(snapshot.state_blob))
-        snapshot_version = snapshot.version
+    if snapshot is not None:
+        print(f"✔ Found snapshot covering events up to #{last_event_id}, applying...")
+        state.apply_snapshot_dict(snapshot)
     else:
         print("⚠ No snapshot found")
-        snapshot_version = 0
-
-    # Step 2: Replay events since snapshot
-    events = event_store.get_all_events()
-    for event in events:
-        if event.event_type.value == "ENROLLMENT":
-            payload = event.payload
-            if payload["action"] == "ENROLL":
-                state.enroll_student(payload["section_id"], payload["student_id"])
-            elif payload["action"] == "DROP":
-                state.drop_student(payload["section_id"], payload["student_id"])
+
+    # Step 2: Replay only the events the snapshot does not already cover
+    replayed = 0
+    for event in iter_events_after(db, last_event_id, "ENROLLMENT"):
+        payload = json.loads(event["payload"])
+        if payload["action"] == "ENROLL":
+            state.enroll_student(payload["section_id"], payload["student_id"])
+        elif payload["action"] == "DROP":
+            state.drop_student(payload["section_id"], payload["student_id"])
+        last_event_id = event["id"]
+        replayed += 1
+
+    print(f"✔ Replayed {replayed} events since snapshot.")
+
+    # Step 3: Move the high-water mark forward for the next cold start
+    save_snapshot(db, SNAPSHOT_KEY, state.to_snapshot_dict(), last_event_id)
 
     print("✔ Rebuild complete.")
     print("Rebuilt enrollment state:", state.all_enrollments())
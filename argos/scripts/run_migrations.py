@@ -5,6 +5,12 @@ from common.infrastructure.db.schema_init import create_schema
 from common.infrastructure.migration_dsl.migration_runner import MigrationRunner
 from data.migrations.m001_add_student_status import AddStudentStatusMigration
 from data.migrations.m002_add_enrollment_created_at import AddEnrollmentCreatedAtMigration
+from data.migrations.m003_add_event_aggregate_stream import AddEventAggregateStreamMigration
+from data.migrations.m004_add_snapshot_last_event_id import AddSnapshotLastEventIdMigration
+from data.migrations.m005_add_enrollment_student_section_unique import (
+    AddEnrollmentStudentSectionUniqueMigration,
+)
+from data.migrations.m006_add_enrollment_section_index import AddEnrollmentSectionIndexMigration
 
 
 def main():
@@ -16,6 +22,10 @@ def main():
     migrations = [
         AddStudentStatusMigration(),
         AddEnrollmentCreatedAtMigration(),
+        AddEventAggregateStreamMigration(),
+        AddSnapshotLastEventIdMigration(),
+        AddEnrollmentStudentSectionUniqueMigration(),
+        AddEnrollmentSectionIndexMigration(),
     ]
 
     runner = MigrationRunner(db, migrations)
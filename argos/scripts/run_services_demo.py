@@ -44,8 +44,8 @@ def main():
     print(f"Scheduler entries for {section_id}: {schedule_entries}")
 
     # Optional: show number of events in store
-    all_events = event_store.get_all_events()
-    print(f"Total events stored: {len(all_events)}")
+    total_events = db.query_all("SELECT COUNT(*) AS n FROM events")[0]["n"]
+    print(f"Total events stored: {total_events}")
 
     db.close()
 
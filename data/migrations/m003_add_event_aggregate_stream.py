@@ -0,0 +1,73 @@
+# Migration m003: Add per-aggregate stream columns and index to events table.
+
+from common.infrastructure.migration_dsl.migration import Migration
+
+
+class AddEventAggregateStreamMigration(Migration):
+    @property
+    def id(self) -> str:
+        return "m003_add_event_aggregate_stream"
+
+    def up(self, db):
+        # Check which columns already exist
+        row = db.query_all("PRAGMA table_info(events)")
+        column_names = [r["name"] for r in row]
+
+        if "aggregate_id" in column_names:
+            print("[MIGRATIONS] Column 'aggregate_id' already exists on events, skipping ALTER TABLE.")
+        else:
+            db.execute("ALTER TABLE events ADD COLUMN aggregate_id TEXT")
+            print("[MIGRATIONS] Column 'aggregate_id' added to events.")
+
+        if "aggregate_version" in column_names:
+            print("[MIGRATIONS] Column 'aggregate_version' already exists on events, skipping ALTER TABLE.")
+        else:
+            db.execute("ALTER TABLE events ADD COLUMN aggregate_version INTEGER")
+            print("[MIGRATIONS] Column 'aggregate_version' added to events.")
+
+        # Backfill the aggregate key only for rows whose aggregate is known, so streams of
+        # different aggregate types never share a key. Enrollment events carry both ids;
+        # the section is the aggregate they belong to. Other rows stay NULL (no stream).
+        db.execute(
+            """
+            UPDATE events
+            SET aggregate_id = COALESCE(
+                json_extract(payload, '$.aggregate_id'),
+                CASE WHEN type = 'ENROLLMENT' THEN json_extract(payload, '$.section_id') END
+            )
+            WHERE aggregate_id IS NULL AND json_valid(payload)
+            """
+        )
+
+        # Number each stream in append order, continuing after any version already assigned
+        # so the migration stays safe to re-run.
+        db.execute(
+            """
+            UPDATE events
+            SET aggregate_version = ranked.version
+            FROM (
+                SELECT
+                    e.id,
+                    COALESCE(v.max_version, 0)
+                        + ROW_NUMBER() OVER (PARTITION BY e.aggregate_id ORDER BY e.id) AS version
+                FROM events e
+                LEFT JOIN (
+                    SELECT aggregate_id, MAX(aggregate_version) AS max_version
+                    FROM events
+                    WHERE aggregate_version IS NOT NULL
+                    GROUP BY aggregate_id
+                ) v ON v.aggregate_id = e.aggregate_id
+                WHERE e.aggregate_id IS NOT NULL AND e.aggregate_version IS NULL
+            ) AS ranked
+            WHERE events.id = ranked.id
+            """
+        )
+        print("[MIGRATIONS] Backfilled aggregate_id/aggregate_version on events.")
+
+        # load_stream(aggregate_id, from_version) is a range scan on this index, and the
+        # uniqueness doubles as the optimistic-concurrency check on append.
+        db.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_events_aggregate_stream "
+            "ON events (aggregate_id, aggregate_version)"
+        )
+        print("[MIGRATIONS] Index 'idx_events_aggregate_stream' ensured on events.")
@@ -0,0 +1,23 @@
+# Migration m004: Add "last_event_id" high-water mark column to snapshots table.
+
+from common.infrastructure.migration_dsl.migration import Migration
+
+
+class AddSnapshotLastEventIdMigration(Migration):
+    @property
+    def id(self) -> str:
+        return "m004_add_snapshot_last_event_id"
+
+    def up(self, db):
+        # Check if column already exists
+        row = db.query_all("PRAGMA table_info(snapshots)")
+        column_names = [r["name"] for r in row]
+
+        if "last_event_id" in column_names:
+            print("[MIGRATIONS] Column 'last_event_id' already exists on snapshots, skipping ALTER TABLE.")
+            return
+
+        # Existing snapshots keep mark 0: which events they cover is unknown, so they
+        # are rebuilt with a full replay rather than risk skipping events.
+        db.execute("ALTER TABLE snapshots ADD COLUMN last_event_id INTEGER NOT NULL DEFAULT 0")
+        print("[MIGRATIONS] Column 'last_event_id' added to snapshots.")
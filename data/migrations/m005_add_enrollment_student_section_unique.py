@@ -0,0 +1,44 @@
+# Migration m005: Deduplicate enrollments and enforce UNIQUE(student_id, section_id).
+
+from common.infrastructure.migration_dsl.migration import Migration
+
+
+class AddEnrollmentStudentSectionUniqueMigration(Migration):
+    @property
+    def id(self) -> str:
+        return "m005_add_enrollment_student_section_unique"
+
+    def up(self, db):
+        # Check if index already exists
+        row = db.query_all("PRAGMA index_list(enrollments)")
+        index_names = [r["name"] for r in row]
+
+        if "ux_enrollments_student_section" in index_names:
+            print("[MIGRATIONS] Index 'ux_enrollments_student_section' already exists, skipping.")
+            return
+
+        # Keep the earliest enrollment (smallest created_at, then first inserted)
+        # of each (student, section) pair and delete the rest
+        duplicates = """
+            SELECT rowid FROM (
+                SELECT
+                    rowid,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY student_id, section_id
+                        ORDER BY created_at IS NULL, created_at, rowid
+                    ) AS rn
+                FROM enrollments
+            )
+            WHERE rn > 1
+        """
+        removed = db.query_all(f"SELECT COUNT(*) AS n FROM ({duplicates})")[0]["n"]
+        db.execute(f"DELETE FROM enrollments WHERE rowid IN ({duplicates})")
+        print(f"[MIGRATIONS] Removed {removed} duplicate enrollment(s).")
+
+        # student_id is the leading column, so this index also serves
+        # "enrollments for a student" lookups.
+        db.execute(
+            "CREATE UNIQUE INDEX ux_enrollments_student_section "
+            "ON enrollments (student_id, section_id)"
+        )
+        print("[MIGRATIONS] Index 'ux_enrollments_student_section' added to enrollments.")
@@ -0,0 +1,21 @@
+# Migration m006: Add index on enrollments(section_id).
+
+from common.infrastructure.migration_dsl.migration import Migration
+
+
+class AddEnrollmentSectionIndexMigration(Migration):
+    @property
+    def id(self) -> str:
+        return "m006_add_enrollment_section_index"
+
+    def up(self, db):
+        # Check if index already exists
+        row = db.query_all("PRAGMA index_list(enrollments)")
+        index_names = [r["name"] for r in row]
+
+        if "idx_enrollments_section_id" in index_names:
+            print("[MIGRATIONS] Index 'idx_enrollments_section_id' already exists, skipping.")
+            return
+
+        db.execute("CREATE INDEX idx_enrollments_section_id ON enrollments (section_id)")
+        print("[MIGRATIONS] Index 'idx_enrollments_section_id' added to enrollments.")
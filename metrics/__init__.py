@@ -0,0 +1,9 @@
+"""
+In-process metrics for Argos.
+
+Provides:
+- Counter, Gauge and fixed-bucket Histogram metrics
+- MetricsRegistry with Prometheus text exposition
+- REGISTRY, the default process-wide registry
+"""
+from .registry import REGISTRY, Counter, Gauge, Histogram, MetricsRegistry
@@ -0,0 +1,189 @@
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Union
+
+Number = Union[int, float]
+
+# Seconds; suited to in-process hot paths from sub-millisecond to seconds.
+DEFAULT_BUCKETS: Sequence[float] = (
+    0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+def _format_value(value: Number) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """
+    Monotonically increasing count, e.g. number of events appended.
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help_text = help_text
+        self._value: Number = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: Number = 1) -> None:
+        if amount < 0:
+            raise ValueError("Counter can only be incremented by a non-negative amount.")
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> Number:
+        return self._value
+
+    def samples(self) -> List[str]:
+        return [f"{self.name} {_format_value(self._value)}"]
+
+
+class Gauge:
+    """
+    Value that can go up and down, e.g. current queue depth.
+    """
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help_text = help_text
+        self._value: Number = 0
+        self._lock = threading.Lock()
+
+    def set(self, value: Number) -> None:
+        with self._lock:
+            self._value = value
+
+    def inc(self, amount: Number = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: Number = 1) -> None:
+        with self._lock:
+            self._value -= amount
+
+    @property
+    def value(self) -> Number:
+        return self._value
+
+    def samples(self) -> List[str]:
+        return [f"{self.name} {_format_value(self._value)}"]
+
+
+class Histogram:
+    """
+    Distribution of observations over fixed upper-bound buckets, e.g.
+    latency in seconds. Observing is a bisect plus three additions.
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        bounds = sorted(buckets)
+        if not bounds:
+            raise ValueError("Histogram needs at least one bucket.")
+        self.name = name
+        self.help_text = help_text
+        self.buckets: List[float] = bounds
+        # One count per bucket plus the implicit +Inf bucket (non-cumulative)
+        self._counts: List[int] = [0] * (len(bounds) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            counts = list(self._counts)
+            total, count = self._sum, self._count
+        lines: List[str] = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets + [float("inf")], counts):
+            cumulative += bucket_count
+            lines.append(f'{self.name}_bucket{{le="{_format_value(bound)}"}} {cumulative}')
+        lines.append(f"{self.name}_sum {_format_value(total)}")
+        lines.append(f"{self.name}_count {count}")
+        return lines
+
+
+Metric = Union[Counter, Gauge, Histogram]
+
+
+class MetricsRegistry:
+    """
+    Holds named metrics and renders them in the Prometheus text format.
+
+    Metrics are get-or-create by name, so modules can declare the metrics
+    they update at import time without coordinating with each other.
+
+    Typical usage:
+
+        requests = REGISTRY.counter("argos_requests_total", "Requests handled.")
+        requests.inc()
+        text = REGISTRY.render_prometheus()
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, help_text: str, **kwargs) -> Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = cls(name, help_text, **kwargs)
+                self._metrics[name] = metric
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name!r} is already registered as a {metric.kind}.")
+            return metric
+
+    def counter(self, name: str, help_text: str) -> Counter:
+        return self._get_or_create(Counter, name, help_text)
+
+    def gauge(self, name: str, help_text: str) -> Gauge:
+        return self._get_or_create(Gauge, name, help_text)
+
+    def histogram(
+        self, name: str, help_text: str, buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, help_text, buckets=buckets)
+
+    def get(self, name: str) -> Metric:
+        return self._metrics[name]
+
+    def render_prometheus(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format
+        (content type "text/plain; version=0.0.4").
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines: List[str] = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.help_text}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
@@ -4,5 +4,15 @@ Enrollment predictor package.
 Provides:
 - Synthetic dataset generator
 - EnrollmentPredictor model wrapper
+
+EnrollmentPredictor is loaded lazily on first attribute access so that
+importing the package (e.g. for the dataset generator) stays cheap.
 """
-from .models.enrollment_predictor import EnrollmentPredictor
+
+
+def __getattr__(name):
+    if name == "EnrollmentPredictor":
+        from .models.enrollment_predictor import EnrollmentPredictor
+
+        return EnrollmentPredictor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1 +1,6 @@
-from .enrollment_predictor import EnrollmentPredictor
+def __getattr__(name):
+    if name == "EnrollmentPredictor":
+        from .enrollment_predictor import EnrollmentPredictor
+
+        return EnrollmentPredictor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
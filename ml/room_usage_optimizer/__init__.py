@@ -3,5 +3,14 @@ Room usage optimizer package.
 
 Provides:
 - RoomUsageOptimizer for simple timetable allocation heuristics.
+
+RoomUsageOptimizer is loaded lazily on first attribute access.
 """
-from .models.room_usage_optimizer import RoomUsageOptimizer
+
+
+def __getattr__(name):
+    if name == "RoomUsageOptimizer":
+        from .models.room_usage_optimizer import RoomUsageOptimizer
+
+        return RoomUsageOptimizer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1 +1,6 @@
-from .room_usage_optimizer import RoomUsageOptimizer
+def __getattr__(name):
+    if name == "RoomUsageOptimizer":
+        from .room_usage_optimizer import RoomUsageOptimizer
+
+        return RoomUsageOptimizer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,18 @@
+import time
 from dataclasses import dataclass
 from typing import Dict, List, Tuple, Iterable
 
+from metrics import REGISTRY
+
+_OPTIMIZE_SECONDS = REGISTRY.histogram(
+    "argos_room_usage_optimizer_optimize_seconds",
+    "Latency of RoomUsageOptimizer.optimize() in seconds.",
+)
+_ASSIGNMENTS_TOTAL = REGISTRY.counter(
+    "argos_room_usage_optimizer_assignments_total",
+    "Room assignments produced by RoomUsageOptimizer.optimize().",
+)
+
 
 @dataclass
 class Room:
@@ -77,6 +89,7 @@ class RoomUsageOptimizer:
 
         Returns a list of RoomAssignment objects.
         """
+        start = time.perf_counter()
         rooms = list(rooms)
         class_requests = list(class_requests)
         assignments: List[RoomAssignment] = []
@@ -127,4 +140,6 @@ class RoomUsageOptimizer:
                     )
                 )
 
+        _ASSIGNMENTS_TOTAL.inc(len(assignments))
+        _OPTIMIZE_SECONDS.observe(time.perf_counter() - start)
         return assignments
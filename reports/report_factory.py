@@ -1,16 +1,25 @@
-from reports.implementations.admin_summary_report import AdminSummaryReport
-from reports.implementations.lecturer_course_performance_report import LecturerCoursePerformanceReport
-from reports.implementations.compliance_audit_report import ComplianceAuditReport
-
 class ReportFactory:
+    """
+    Builds concrete reports. Implementations are imported on first use so
+    that importing the factory does not load every report module.
+    """
+
     @staticmethod
     def admin_report(stats: dict):
+        from reports.implementations.admin_summary_report import AdminSummaryReport
+
         return AdminSummaryReport(stats)
 
     @staticmethod
     def lecturer_report(course_id: str, stats: dict):
+        from reports.implementations.lecturer_course_performance_report import (
+            LecturerCoursePerformanceReport,
+        )
+
         return LecturerCoursePerformanceReport(course_id, stats)
 
     @staticmethod
     def compliance_report(violations: list, passed: list):
+        from reports.implementations.compliance_audit_report import ComplianceAuditReport
+
         return ComplianceAuditReport(violations, passed)
@@ -0,0 +1,149 @@
+"""
+Benchmark definitions for core hot paths.
+
+Each entry in BENCHMARKS maps a name to (setup, sizes): setup(size) builds
+the input data once and returns a zero-argument callable that runs the
+operation under test; sizes are the default data sizes to parametrize over.
+"""
+
+import importlib.util
+import random
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from metrics.registry import MetricsRegistry
+from ml.enrollment_predictor.generate_synthetic_enrollment import generate_synthetic_enrollment
+from ml.enrollment_predictor.models.enrollment_predictor import (
+    EnrollmentPredictor,
+    EnrollmentPredictorConfig,
+)
+from ml.room_usage_optimizer.models.room_usage_optimizer import (
+    ClassRequest,
+    Room,
+    RoomUsageOptimizer,
+)
+from verification.models.invariants import check_no_time_overlap
+
+SEED = 42
+
+
+def predictor_backend() -> str:
+    """
+    Backend EnrollmentPredictor.train() ends up using in this environment:
+    scikit-learn when it is installed, the heuristic fallback otherwise.
+    """
+    return "sklearn-logistic" if importlib.util.find_spec("sklearn") else "heuristic"
+
+
+def _predictor_workload(
+    size: int, config: EnrollmentPredictorConfig
+) -> Callable[[], object]:
+    """
+    Score `size` students with a predictor trained on a synthetic dataset.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "enrollment.csv"
+        generate_synthetic_enrollment(2000, csv_path, seed=SEED)
+        predictor = EnrollmentPredictor(config)
+        predictor.train(csv_path)
+
+    rng = random.Random(SEED)
+    batch = [
+        {
+            "attendance_rate": rng.random(),
+            "current_gpa": rng.uniform(0.0, 4.0),
+            "course_load": rng.randint(1, 7),
+            "past_failures": rng.randint(0, 5),
+        }
+        for _ in range(size)
+    ]
+    return lambda: [predictor.predict(features) for features in batch]
+
+
+def setup_predictor_predict(size: int) -> Callable[[], object]:
+    """
+    Score `size` students with the default (uninstrumented) predictor.
+    """
+    return _predictor_workload(size, EnrollmentPredictorConfig())
+
+
+def setup_predictor_predict_instrumented(size: int) -> Callable[[], object]:
+    """
+    Same workload as enrollment_predictor_predict with record_metrics on, so
+    the pair of entries shows what latency recording costs on the hot path.
+    """
+    return _predictor_workload(size, EnrollmentPredictorConfig(record_metrics=True))
+
+
+def setup_optimizer_optimize(size: int) -> Callable[[], object]:
+    """
+    Assign `size` class requests spread over 20 timeslots to size // 10 rooms.
+    """
+    rng = random.Random(SEED)
+    rooms = [
+        Room(f"R{i}", capacity=rng.randint(20, 200), base_energy_cost=rng.uniform(5.0, 20.0))
+        for i in range(max(1, size // 10))
+    ]
+    classes = [
+        ClassRequest(f"SEC-{i}", expected_students=rng.randint(10, 180), timeslot=f"T{i % 20}")
+        for i in range(size)
+    ]
+    optimizer = RoomUsageOptimizer()
+    return lambda: optimizer.optimize(rooms, classes)
+
+
+def setup_check_no_time_overlap(size: int) -> Callable[[], object]:
+    """
+    Validate a shuffled timetable of `size` back-to-back, non-overlapping sections.
+    """
+    rng = random.Random(SEED)
+    sections = [
+        {"section_id": f"SEC-{i}", "start": i, "end": i + 1}
+        for i in range(size)
+    ]
+    rng.shuffle(sections)
+    return lambda: check_no_time_overlap(sections)
+
+
+def setup_metrics_histogram_observe(size: int) -> Callable[[], object]:
+    """
+    Record `size` latency observations; median / size is the per-observation
+    overhead added to every instrumented hot path.
+    """
+    histogram = MetricsRegistry().histogram("bench_seconds", "Benchmark histogram.")
+    rng = random.Random(SEED)
+    values = [rng.uniform(0.0, 0.05) for _ in range(size)]
+
+    def run() -> None:
+        observe = histogram.observe
+        for value in values:
+            observe(value)
+
+    return run
+
+
+def setup_metrics_counter_inc(size: int) -> Callable[[], object]:
+    """
+    Increment a counter `size` times; median / size is the per-increment overhead.
+    """
+    counter = MetricsRegistry().counter("bench_total", "Benchmark counter.")
+
+    def run() -> None:
+        inc = counter.inc
+        for _ in range(size):
+            inc()
+
+    return run
+
+
+BENCHMARKS: Dict[str, Tuple[Callable[[int], Callable[[], object]], List[int]]] = {
+    "enrollment_predictor_predict": (setup_predictor_predict, [100, 1000]),
+    "enrollment_predictor_predict_instrumented": (
+        setup_predictor_predict_instrumented, [100, 1000]
+    ),
+    "room_usage_optimizer_optimize": (setup_optimizer_optimize, [100, 1000]),
+    "check_no_time_overlap": (setup_check_no_time_overlap, [1000, 10000]),
+    "metrics_histogram_observe": (setup_metrics_histogram_observe, [10000]),
+    "metrics_counter_inc": (setup_metrics_counter_inc, [10000]),
+}
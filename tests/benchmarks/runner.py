@@ -0,0 +1,192 @@
+"""
+Micro-benchmark runner with regression gating.
+
+Times each benchmark in bench_core.BENCHMARKS for every configured data size
+(after warm-up), writes the results as JSON and compares them against a
+committed baseline, failing when a benchmark's median slows down by more
+than the allowed threshold or a baseline entry of a benchmark selected for
+the run is missing from the results (so `run --bench` subsets can be gated
+too). Comparison is refused (exit 2) when the Python version, machine or
+predictor backend differs from the baseline's, since wall-clock timings from
+another environment are not comparable; re-record the baseline there.
+
+Usage (from project root):
+
+    # Run the suite and write results
+    python -m tests.benchmarks.runner run --out benchmark_results.json
+
+    # Fail (exit 1) if any benchmark regressed more than 25% vs the baseline
+    python -m tests.benchmarks.runner compare benchmark_results.json \\
+        --baseline tests/benchmarks/baseline.json --threshold 0.25
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from tests.benchmarks.bench_core import BENCHMARKS, predictor_backend
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+
+# Fields that must match between results and baseline for timings to be comparable
+ENVIRONMENT_FIELDS = ("python", "machine", "predictor_backend")
+
+
+def time_callable(fn: Callable[[], object], warmup: int, repeat: int) -> Dict[str, float]:
+    """
+    Call fn `warmup` times untimed, then `repeat` times timed, and return
+    min/median/mean wall-clock seconds per call.
+    """
+    for _ in range(warmup):
+        fn()
+
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+
+    return {
+        "min_s": min(timings),
+        "median_s": statistics.median(timings),
+        "mean_s": statistics.fmean(timings),
+        "repeat": repeat,
+    }
+
+
+def run_suite(
+    names: Optional[List[str]] = None,
+    sizes: Optional[Dict[str, List[int]]] = None,
+    warmup: int = 3,
+    repeat: int = 15,
+) -> Dict[str, object]:
+    """
+    Run the selected benchmarks and return the results document.
+
+    Results are keyed "<benchmark>[<size>]" so each data size is compared
+    against its own baseline entry.
+    """
+    selected = names or list(BENCHMARKS)
+    results: Dict[str, Dict[str, float]] = {}
+    for name in selected:
+        setup, default_sizes = BENCHMARKS[name]
+        for size in (sizes or {}).get(name, default_sizes):
+            fn = setup(size)
+            results[f"{name}[{size}]"] = time_callable(fn, warmup, repeat)
+
+    return {
+        "python": ".".join(platform.python_version_tuple()[:2]),
+        "machine": platform.machine(),
+        "predictor_backend": predictor_backend(),
+        "warmup": warmup,
+        "benchmarks": selected,
+        "results": results,
+    }
+
+
+def environment_mismatches(current: Dict[str, object], baseline: Dict[str, object]) -> List[str]:
+    """
+    Return a message for every environment field that differs between the
+    results and the baseline; timings from different environments are not
+    comparable.
+    """
+    return [
+        f"{field}: results {current.get(field)!r} vs baseline {baseline.get(field)!r}"
+        for field in ENVIRONMENT_FIELDS
+        if current.get(field) != baseline.get(field)
+    ]
+
+
+def compare(
+    current: Dict[str, object], baseline: Dict[str, object], threshold: float
+) -> List[str]:
+    """
+    Return a message for every benchmark whose median is slower than its
+    baseline median by more than threshold (a fraction, e.g. 0.25 = 25%),
+    and for every baseline entry of a selected benchmark missing from the
+    results. Benchmarks left out of the run (run --bench) are not reported.
+    """
+    regressions: List[str] = []
+    results = current["results"]
+    # Results written before runs recorded their selection were full-suite runs
+    selected = current.get("benchmarks")
+    for key, base in baseline["results"].items():
+        stats = results.get(key)
+        if stats is None:
+            if selected is None or key.partition("[")[0] in selected:
+                regressions.append(f"{key}: missing from results")
+            continue
+        ratio = stats["median_s"] / base["median_s"] if base["median_s"] else 1.0
+        if ratio > 1 + threshold:
+            regressions.append(
+                f"{key}: median {stats['median_s'] * 1e3:.3f}ms vs baseline "
+                f"{base['median_s'] * 1e3:.3f}ms ({(ratio - 1) * 100:+.1f}%)"
+            )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run and gate Argos micro-benchmarks.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_p = sub.add_parser("run", help="Run the benchmark suite")
+    run_p.add_argument(
+        "--bench", action="append", choices=sorted(BENCHMARKS),
+        help="Benchmark to run (repeatable, default: all)",
+    )
+    run_p.add_argument("--warmup", type=int, default=3, help="Untimed warm-up calls (default: 3)")
+    run_p.add_argument("--repeat", type=int, default=15, help="Timed calls (default: 15)")
+    run_p.add_argument("--out", type=str, help="Write results JSON to this path")
+
+    cmp_p = sub.add_parser("compare", help="Compare a results file against the baseline")
+    cmp_p.add_argument("results", type=str, help="Results JSON produced by 'run --out'")
+    cmp_p.add_argument(
+        "--baseline", type=str, default=str(DEFAULT_BASELINE),
+        help="Baseline JSON (default: tests/benchmarks/baseline.json)",
+    )
+    cmp_p.add_argument(
+        "--threshold", type=float, default=0.25,
+        help="Allowed slowdown as a fraction of the baseline (default: 0.25)",
+    )
+    cmp_p.add_argument(
+        "--allow-env-mismatch", action="store_true",
+        help="Compare even if python/machine/predictor backend differ from the baseline",
+    )
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        doc = run_suite(args.bench, warmup=args.warmup, repeat=args.repeat)
+        for key, stats in doc["results"].items():
+            print(f"{key:<45} median {stats['median_s'] * 1e3:10.3f}ms"
+                  f"   min {stats['min_s'] * 1e3:10.3f}ms")
+        if args.out:
+            Path(args.out).write_text(json.dumps(doc, indent=2), encoding="utf-8")
+        return
+
+    current = json.loads(Path(args.results).read_text(encoding="utf-8"))
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+
+    mismatches = environment_mismatches(current, baseline)
+    for message in mismatches:
+        print(f"ENVIRONMENT MISMATCH {message}")
+    if mismatches and not args.allow_env_mismatch:
+        print("Refusing to compare timings from a different environment; re-record the "
+              "baseline on this machine or pass --allow-env-mismatch.")
+        sys.exit(2)
+
+    regressions = compare(current, baseline, args.threshold)
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    if regressions:
+        sys.exit(1)
+    print("No benchmark regressions.")
+
+
+if __name__ == "__main__":
+    main()
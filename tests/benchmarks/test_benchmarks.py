@@ -0,0 +1,63 @@
+import json
+
+from tests.benchmarks.bench_core import BENCHMARKS
+from tests.benchmarks.runner import DEFAULT_BASELINE, compare, environment_mismatches, run_suite
+
+
+def test_every_benchmark_runs_on_small_inputs():
+    doc = run_suite(sizes={name: [10] for name in BENCHMARKS}, warmup=0, repeat=1)
+
+    assert set(doc["results"]) == {f"{name}[10]" for name in BENCHMARKS}
+    for stats in doc["results"].values():
+        assert stats["median_s"] >= 0
+
+
+def test_baseline_covers_every_default_size():
+    baseline = json.loads(DEFAULT_BASELINE.read_text(encoding="utf-8"))
+    expected = {
+        f"{name}[{size}]" for name, (_, sizes) in BENCHMARKS.items() for size in sizes
+    }
+    assert expected <= set(baseline["results"])
+
+
+def test_compare_flags_only_regressions_beyond_threshold():
+    baseline = {"results": {"a[10]": {"median_s": 1.0}, "b[10]": {"median_s": 1.0}}}
+    current = {"results": {"a[10]": {"median_s": 1.2}, "b[10]": {"median_s": 1.5}}}
+
+    regressions = compare(current, baseline, threshold=0.25)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("b[10]")
+
+
+def test_compare_reports_baseline_benchmarks_missing_from_results():
+    baseline = {"results": {"a[10]": {"median_s": 1.0}, "b[10]": {"median_s": 1.0}}}
+    current = {"results": {"a[10]": {"median_s": 1.0}}}
+
+    assert compare(current, baseline, threshold=0.25) == ["b[10]: missing from results"]
+
+
+def test_compare_ignores_benchmarks_not_selected_for_the_run():
+    baseline = {"results": {
+        "a[10]": {"median_s": 1.0}, "a[100]": {"median_s": 1.0}, "b[10]": {"median_s": 1.0},
+    }}
+    current = {"benchmarks": ["a"], "results": {"a[10]": {"median_s": 1.0}}}
+
+    assert compare(current, baseline, threshold=0.25) == ["a[100]: missing from results"]
+
+
+def test_subset_run_records_selected_benchmarks():
+    doc = run_suite(
+        ["check_no_time_overlap"], sizes={"check_no_time_overlap": [10]}, warmup=0, repeat=1
+    )
+
+    assert doc["benchmarks"] == ["check_no_time_overlap"]
+
+
+def test_environment_mismatches_cover_python_machine_and_backend():
+    doc = run_suite(sizes={name: [10] for name in BENCHMARKS}, warmup=0, repeat=1)
+    assert environment_mismatches(doc, dict(doc)) == []
+
+    other = dict(doc, python="0.0", predictor_backend="other")
+    mismatches = environment_mismatches(doc, other)
+    assert [m.split(":")[0] for m in mismatches] == ["python", "predictor_backend"]
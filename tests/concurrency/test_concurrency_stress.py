@@ -57,7 +57,7 @@ def test_concurrent_enrollments():
     assert len(schedule_entries) == len(all_student_ids)
 
     expected_events = len(all_student_ids) * 3
-    all_events = event_store.get_all_events()
-    assert len(all_events) == expected_events, (
-        f"Expected {expected_events} events, got {len(all_events)}"
+    total_events = db.query_all("SELECT COUNT(*) AS n FROM events")[0]["n"]
+    assert total_events == expected_events, (
+        f"Expected {expected_events} events, got {total_events}"
     )
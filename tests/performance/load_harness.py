@@ -0,0 +1,311 @@
+"""
+Scenario-driven load harness for the Argos API.
+
+Runs scripted scenarios either in-process against the ASGI app or against a
+running uvicorn server, and reports p50/p95/p99 latency and throughput per
+scenario. Results can be saved as JSON and compared against a stored baseline
+so throughput regressions are caught before deploying.
+
+Usage (from project root):
+
+    # In-process against the app factory
+    python -m tests.performance.load_harness --asgi api.app:create_app --factory \\
+        --out load_results.json
+
+    # Against a local uvicorn and compared to a previous run
+    python -m tests.performance.load_harness --url http://127.0.0.1:8000 \\
+        --baseline load_baseline.json --tolerance 0.2
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+import math
+import random
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+STUDENTS_PATH = "/students"
+ENROLLMENTS_PATH = "/enrollments"
+
+# (latency in seconds, HTTP status or 0 for a transport error)
+Sample = Tuple[float, int]
+# Samples of the measured phase and its wall-clock duration in seconds
+ScenarioResult = Tuple[List[Sample], float]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of values (pct in 0-100): the smallest value
+    with at least pct percent of the samples at or below it.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(samples: List[Sample], duration: float) -> Dict[str, float]:
+    """
+    Reduce raw samples to the latency/throughput figures stored in results.
+    """
+    latencies = [latency for latency, _ in samples]
+    errors = sum(1 for _, status in samples if status == 0 or status >= 400)
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "duration_s": round(duration, 4),
+        "throughput_rps": round(len(samples) / duration, 2) if duration > 0 else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+    }
+
+
+async def timed_request(
+    client: httpx.AsyncClient, samples: List[Sample], method: str, url: str, **kwargs
+) -> Optional[httpx.Response]:
+    """
+    Issue one request and record its latency and status in samples.
+    """
+    start = time.perf_counter()
+    try:
+        resp = await client.request(method, url, **kwargs)
+    except httpx.HTTPError:
+        samples.append((time.perf_counter() - start, 0))
+        return None
+    samples.append((time.perf_counter() - start, resp.status_code))
+    return resp
+
+
+async def create_student(client: httpx.AsyncClient) -> str:
+    """
+    Create a student outside of any measurement and return its id.
+    """
+    suffix = uuid.uuid4().hex[:12]
+    resp = await client.post(STUDENTS_PATH, json={
+        "name": f"Load {suffix}",
+        "email": f"load-{suffix}@example.com",
+        "status": "ACTIVE",
+    })
+    resp.raise_for_status()
+    return resp.json()["id"]
+
+
+# ----------------------------------------------------------------------
+# Scenarios
+# ----------------------------------------------------------------------
+async def registration_rush(
+    client: httpx.AsyncClient, concurrency: int, requests_per_client: int
+) -> ScenarioResult:
+    """
+    Every client enrolls fresh students into the same hot section at once.
+    """
+    section_id = f"SEC-HOT-{uuid.uuid4().hex[:8]}"
+    student_ids = [
+        await create_student(client) for _ in range(concurrency * requests_per_client)
+    ]
+    samples: List[Sample] = []
+
+    async def worker(ids: List[str]) -> None:
+        for student_id in ids:
+            await timed_request(client, samples, "POST", ENROLLMENTS_PATH, json={
+                "student_id": student_id,
+                "section_id": section_id,
+            })
+
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        worker(student_ids[i::concurrency]) for i in range(concurrency)
+    ))
+    return samples, time.perf_counter() - start
+
+
+async def mixed_reads_and_enrollments(
+    client: httpx.AsyncClient,
+    concurrency: int,
+    requests_per_client: int,
+    read_ratio: float = 0.8,
+    seed: int = 42,
+) -> ScenarioResult:
+    """
+    Clients mostly read students back and occasionally enroll them in one
+    of a handful of sections.
+
+    Every worker draws from its own seeded generator, so the requests each
+    worker sends do not depend on timing. Enrollment pairs are drawn without
+    replacement, so no write is rejected as a duplicate enrollment.
+    """
+    rngs = [random.Random(seed + i) for i in range(concurrency)]
+    plans = [
+        [rng.random() < read_ratio for _ in range(requests_per_client)]
+        for rng in rngs
+    ]
+    writes = sum(plan.count(False) for plan in plans)
+
+    section_ids = [f"SEC-MIX-{i}" for i in range(5)]
+    n_students = max(10, concurrency, -(-writes // len(section_ids)))
+    student_ids = [await create_student(client) for _ in range(n_students)]
+
+    pairs = [(student_id, section_id) for student_id in student_ids for section_id in section_ids]
+    random.Random(seed).shuffle(pairs)
+    worker_pairs: List[List[Tuple[str, str]]] = []
+    for plan in plans:
+        n_writes = plan.count(False)
+        worker_pairs.append(pairs[:n_writes])
+        pairs = pairs[n_writes:]
+
+    samples: List[Sample] = []
+
+    async def worker(
+        plan: List[bool], rng: random.Random, own_pairs: List[Tuple[str, str]]
+    ) -> None:
+        pair_iter = iter(own_pairs)
+        for is_read in plan:
+            if is_read:
+                student_id = rng.choice(student_ids)
+                await timed_request(client, samples, "GET", f"{STUDENTS_PATH}/{student_id}")
+            else:
+                student_id, section_id = next(pair_iter)
+                await timed_request(client, samples, "POST", ENROLLMENTS_PATH, json={
+                    "student_id": student_id,
+                    "section_id": section_id,
+                })
+
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        worker(plan, rng, own_pairs) for plan, rng, own_pairs in zip(plans, rngs, worker_pairs)
+    ))
+    return samples, time.perf_counter() - start
+
+
+SCENARIOS: Dict[str, Callable] = {
+    "registration_rush": registration_rush,
+    "mixed_reads_and_enrollments": mixed_reads_and_enrollments,
+}
+
+
+# ----------------------------------------------------------------------
+# Running & comparing
+# ----------------------------------------------------------------------
+def load_asgi_app(target: str, factory: bool = False):
+    """
+    Resolve "module:attr" to an ASGI app, calling attr when it is a factory.
+    """
+    module_name, _, attr = target.partition(":")
+    obj = getattr(importlib.import_module(module_name), attr or "app")
+    return obj() if factory else obj
+
+
+def make_client(url: Optional[str] = None, app=None) -> httpx.AsyncClient:
+    """
+    Build an AsyncClient for a live server (url) or an in-process ASGI app.
+    """
+    if app is not None:
+        return httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://argos", timeout=30.0
+        )
+    return httpx.AsyncClient(base_url=url, timeout=30.0)
+
+
+async def run_scenarios(
+    client: httpx.AsyncClient,
+    names: List[str],
+    concurrency: int,
+    requests_per_client: int,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Run each named scenario in turn and return its summary keyed by name.
+    """
+    results: Dict[str, Dict[str, float]] = {}
+    for name in names:
+        samples, duration = await SCENARIOS[name](client, concurrency, requests_per_client)
+        results[name] = summarize(samples, duration)
+    return results
+
+
+def compare_to_baseline(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float,
+) -> List[str]:
+    """
+    Return a message for every scenario whose p99 latency grew, or whose
+    throughput fell, by more than tolerance (a fraction) versus baseline.
+    """
+    regressions: List[str] = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if base["p99_ms"] > 0 and current["p99_ms"] > base["p99_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: p99 {current['p99_ms']}ms vs baseline {base['p99_ms']}ms"
+            )
+        if current["throughput_rps"] < base["throughput_rps"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: throughput {current['throughput_rps']} rps "
+                f"vs baseline {base['throughput_rps']} rps"
+            )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Scenario-driven load harness for the Argos API.")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--url", help="Base URL of a running server, e.g. http://127.0.0.1:8000")
+    target.add_argument("--asgi", help="In-process ASGI app, e.g. api.app:create_app")
+    parser.add_argument(
+        "--factory", action="store_true", help="Treat the --asgi target as an app factory"
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="Scenario to run (repeatable, default: all)",
+    )
+    parser.add_argument("--concurrency", type=int, default=50, help="Concurrent clients (default: 50)")
+    parser.add_argument(
+        "--requests", type=int, default=20, help="Requests per client (default: 20)"
+    )
+    parser.add_argument("--out", type=str, help="Write results JSON to this path")
+    parser.add_argument("--baseline", type=str, help="Baseline results JSON to compare against")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed regression as a fraction of the baseline (default: 0.2)",
+    )
+    args = parser.parse_args()
+
+    async def _run() -> Dict[str, Dict[str, float]]:
+        app = load_asgi_app(args.asgi, args.factory) if args.asgi else None
+        async with make_client(args.url, app) as client:
+            return await run_scenarios(
+                client, args.scenario or list(SCENARIOS), args.concurrency, args.requests
+            )
+
+    results = asyncio.run(_run())
+    print(json.dumps(results, indent=2))
+
+    if args.out:
+        Path(args.out).write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare_to_baseline(results, baseline, args.tolerance)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
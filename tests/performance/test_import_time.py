@@ -0,0 +1,22 @@
+"""
+Bounds on cold import time, measured in a fresh interpreter with -X importtime.
+"""
+
+import pytest
+
+from argos.scripts.profile_imports import import_time_us
+
+# Generous ceilings: they catch a heavy dependency creeping onto the import
+# path, not normal machine-to-machine variance.
+API_APP_MAX_MS = 1500
+ML_PACKAGE_MAX_MS = 100
+
+
+def test_api_app_import_time_is_bounded():
+    pytest.importorskip("api.app")
+    assert import_time_us("api.app") / 1000 < API_APP_MAX_MS
+
+
+def test_ml_package_import_time_is_bounded():
+    for module in ("ml.enrollment_predictor", "ml.room_usage_optimizer"):
+        assert import_time_us(module) / 1000 < ML_PACKAGE_MAX_MS, module
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from tests.performance.load_harness import (
+    SCENARIOS,
+    compare_to_baseline,
+    make_client,
+    mixed_reads_and_enrollments,
+    percentile,
+    run_scenarios,
+)
+
+
+def test_scenarios_run_in_process_without_errors():
+    create_test_client = pytest.importorskip("api.test_app_factory").create_test_client
+    client, *_ = create_test_client()
+
+    async def _run():
+        async with make_client(app=client.app) as http:
+            return await run_scenarios(http, list(SCENARIOS), concurrency=4, requests_per_client=3)
+
+    results = asyncio.run(_run())
+
+    for name in SCENARIOS:
+        assert results[name]["requests"] == 12
+        assert results[name]["errors"] == 0
+        assert results[name]["p50_ms"] <= results[name]["p95_ms"] <= results[name]["p99_ms"]
+
+
+def test_mixed_scenario_never_repeats_an_enrollment():
+    create_test_client = pytest.importorskip("api.test_app_factory").create_test_client
+    client, *_ = create_test_client()
+    posted = []
+
+    async def _run():
+        async with make_client(app=client.app) as http:
+            http.event_hooks["request"].append(_record_enrollment)
+            return await mixed_reads_and_enrollments(http, concurrency=20, requests_per_client=20)
+
+    async def _record_enrollment(request):
+        if request.method == "POST" and request.url.path == "/enrollments":
+            posted.append(request.content)
+
+    samples, _ = asyncio.run(_run())
+
+    assert posted
+    assert len(posted) == len(set(posted))
+    assert all(status < 400 for _, status in samples)
+
+
+def test_percentile_uses_nearest_rank():
+    values = [float(i) for i in range(1, 13)]
+    assert percentile(values, 95) == 12.0
+    assert percentile(values, 50) == 6.0
+
+    values = [float(i) for i in range(1, 151)]
+    assert percentile(values, 99) == 149.0
+    assert percentile(values, 100) == 150.0
+    assert percentile([], 99) == 0.0
+
+
+def test_compare_to_baseline_flags_regressions():
+    baseline = {"registration_rush": {"p99_ms": 10.0, "throughput_rps": 1000.0}}
+
+    within = {"registration_rush": {"p99_ms": 11.0, "throughput_rps": 900.0}}
+    assert compare_to_baseline(within, baseline, tolerance=0.2) == []
+
+    slower = {"registration_rush": {"p99_ms": 15.0, "throughput_rps": 500.0}}
+    assert len(compare_to_baseline(slower, baseline, tolerance=0.2)) == 2
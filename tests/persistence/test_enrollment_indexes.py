@@ -0,0 +1,53 @@
+from common.infrastructure.db.database import Database
+from common.infrastructure.db.schema import create_schema
+from data.migrations.m005_add_enrollment_student_section_unique import (
+    AddEnrollmentStudentSectionUniqueMigration,
+)
+from data.migrations.m006_add_enrollment_section_index import AddEnrollmentSectionIndexMigration
+
+
+def _insert_enrollment(
+    db, enrollment_id, student_id, section_id, created_at="2024-01-02T00:00:00"
+):
+    db.execute(
+        "INSERT INTO enrollments (id, student_id, section_id, created_at) VALUES (?, ?, ?, ?)",
+        (enrollment_id, student_id, section_id, created_at),
+    )
+
+
+def _query_plan(db, sql, params):
+    rows = db.query_all(f"EXPLAIN QUERY PLAN {sql}", params)
+    return " ".join(r["detail"] for r in rows)
+
+
+def _migrated_db():
+    db = Database(":memory:")
+    create_schema(db)
+    _insert_enrollment(db, "E-1", "STU-1", "SEC-1")
+    _insert_enrollment(db, "E-2", "STU-1", "SEC-1", created_at="2024-01-01T00:00:00")
+    _insert_enrollment(db, "E-3", "STU-2", "SEC-1")
+
+    AddEnrollmentStudentSectionUniqueMigration().up(db)
+    AddEnrollmentSectionIndexMigration().up(db)
+    return db
+
+
+def test_migration_keeps_earliest_of_duplicate_enrollments():
+    db = _migrated_db()
+
+    rows = db.query_all("SELECT id FROM enrollments ORDER BY id")
+    assert [r["id"] for r in rows] == ["E-2", "E-3"]
+
+
+def test_enrollments_by_student_use_index():
+    db = _migrated_db()
+
+    plan = _query_plan(db, "SELECT * FROM enrollments WHERE student_id = ?", ("STU-1",))
+    assert "USING INDEX ux_enrollments_student_section" in plan
+
+
+def test_enrollments_by_section_use_index():
+    db = _migrated_db()
+
+    plan = _query_plan(db, "SELECT * FROM enrollments WHERE section_id = ?", ("SEC-1",))
+    assert "USING INDEX idx_enrollments_section_id" in plan
@@ -0,0 +1,73 @@
+import json
+
+from common.infrastructure.db.database import Database
+from common.infrastructure.db.schema import create_schema
+from data.migrations.m003_add_event_aggregate_stream import AddEventAggregateStreamMigration
+
+
+def _append_event(db, event_type, payload):
+    db.execute(
+        "INSERT INTO events (type, payload, timestamp) VALUES (?, ?, ?)",
+        (event_type, payload, "2024-01-01T00:00:00"),
+    )
+
+
+def _enroll(db, section_id, student_id):
+    _append_event(db, "ENROLLMENT", json.dumps({
+        "action": "ENROLL", "section_id": section_id, "student_id": student_id,
+    }))
+
+
+def _streams(db):
+    rows = db.query_all("SELECT id, type, aggregate_id, aggregate_version FROM events ORDER BY id")
+    return [(r["type"], r["aggregate_id"], r["aggregate_version"]) for r in rows]
+
+
+def _migrated_db():
+    db = Database(":memory:")
+    create_schema(db)
+    _enroll(db, "SEC-1", "STU-1")
+    _enroll(db, "SEC-2", "STU-1")
+    _append_event(db, "STUDENT_CREATED", json.dumps({"id": "SEC-1"}))
+    _append_event(db, "ENROLLMENT", "not json")
+    _enroll(db, "SEC-1", "STU-2")
+
+    AddEventAggregateStreamMigration().up(db)
+    return db
+
+
+def test_enrollment_events_are_numbered_per_section_in_id_order():
+    db = _migrated_db()
+
+    assert _streams(db) == [
+        ("ENROLLMENT", "SEC-1", 1),
+        ("ENROLLMENT", "SEC-2", 1),
+        ("STUDENT_CREATED", None, None),
+        ("ENROLLMENT", None, None),
+        ("ENROLLMENT", "SEC-1", 2),
+    ]
+
+
+def test_rerun_continues_numbering_after_existing_versions():
+    db = _migrated_db()
+    _enroll(db, "SEC-1", "STU-3")
+    _enroll(db, "SEC-2", "STU-3")
+
+    AddEventAggregateStreamMigration().up(db)
+
+    assert _streams(db)[5:] == [
+        ("ENROLLMENT", "SEC-1", 3),
+        ("ENROLLMENT", "SEC-2", 2),
+    ]
+
+
+def test_stream_lookup_uses_aggregate_index():
+    db = _migrated_db()
+
+    rows = db.query_all(
+        "EXPLAIN QUERY PLAN SELECT * FROM events "
+        "WHERE aggregate_id = ? AND aggregate_version > ? ORDER BY aggregate_version",
+        ("SEC-1", 1),
+    )
+    plan = " ".join(r["detail"] for r in rows)
+    assert "USING INDEX idx_events_aggregate_stream" in plan
@@ -0,0 +1,40 @@
+import pytest
+
+from metrics.registry import MetricsRegistry
+
+
+def test_counter_and_gauge_render_as_prometheus_text():
+    registry = MetricsRegistry()
+    registry.counter("argos_test_total", "Test counter.").inc(3)
+    gauge = registry.gauge("argos_test_depth", "Test gauge.")
+    gauge.set(5)
+    gauge.dec(2)
+
+    text = registry.render_prometheus()
+
+    assert "# TYPE argos_test_total counter\nargos_test_total 3\n" in text
+    assert "# TYPE argos_test_depth gauge\nargos_test_depth 3\n" in text
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("argos_test_seconds", "Test histogram.", buckets=[0.1, 1.0])
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    text = registry.render_prometheus()
+
+    assert 'argos_test_seconds_bucket{le="0.1"} 2' in text
+    assert 'argos_test_seconds_bucket{le="1.0"} 3' in text
+    assert 'argos_test_seconds_bucket{le="+Inf"} 4' in text
+    assert "argos_test_seconds_count 4" in text
+
+
+def test_registry_returns_existing_metric_and_rejects_kind_clash():
+    registry = MetricsRegistry()
+    counter = registry.counter("argos_test_total", "Test counter.")
+
+    assert registry.counter("argos_test_total", "Test counter.") is counter
+    with pytest.raises(ValueError):
+        registry.gauge("argos_test_total", "Clashing gauge.")
+
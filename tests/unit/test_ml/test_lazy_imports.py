@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+
+
+def _modules_loaded_after(import_stmt):
+    code = f"import sys; {import_stmt}; print('\\n'.join(sys.modules))"
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT), env.get("PYTHONPATH")]))
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+        env=env,
+    ).stdout
+    return set(out.split())
+
+
+def test_enrollment_predictor_package_defers_model_import():
+    loaded = _modules_loaded_after("import ml.enrollment_predictor")
+    assert "ml.enrollment_predictor.models.enrollment_predictor" not in loaded
+
+
+def test_room_usage_optimizer_package_defers_model_import():
+    loaded = _modules_loaded_after("import ml.room_usage_optimizer")
+    assert "ml.room_usage_optimizer.models.room_usage_optimizer" not in loaded
+
+
+def test_report_factory_defers_report_implementations():
+    loaded = _modules_loaded_after("import reports.report_factory")
+    assert not any(name.startswith("reports.implementations") for name in loaded)
+
+
+def test_lazy_attributes_resolve_to_model_classes():
+    from ml.enrollment_predictor import EnrollmentPredictor
+    from ml.enrollment_predictor.models.enrollment_predictor import (
+        EnrollmentPredictor as ModelEnrollmentPredictor,
+    )
+    from ml.room_usage_optimizer import RoomUsageOptimizer
+    from ml.room_usage_optimizer.models.room_usage_optimizer import (
+        RoomUsageOptimizer as ModelRoomUsageOptimizer,
+    )
+
+    assert EnrollmentPredictor is ModelEnrollmentPredictor
+    assert RoomUsageOptimizer is ModelRoomUsageOptimizer
@@ -0,0 +1,64 @@
+import pytest
+
+from metrics import REGISTRY
+from ml.enrollment_predictor.generate_synthetic_enrollment import generate_synthetic_enrollment
+from ml.enrollment_predictor.models.enrollment_predictor import (
+    EnrollmentPredictor,
+    EnrollmentPredictorConfig,
+)
+from ml.room_usage_optimizer.models.room_usage_optimizer import (
+    ClassRequest,
+    Room,
+    RoomUsageOptimizer,
+)
+
+FEATURES = {
+    "attendance_rate": 0.9,
+    "current_gpa": 3.2,
+    "course_load": 4,
+    "past_failures": 0,
+}
+
+
+@pytest.fixture(scope="module")
+def enrollment_csv(tmp_path_factory):
+    csv_path = tmp_path_factory.mktemp("enrollment") / "enrollment.csv"
+    generate_synthetic_enrollment(200, csv_path)
+    return csv_path
+
+
+def test_optimizer_records_latency_and_assignments():
+    histogram = REGISTRY.get("argos_room_usage_optimizer_optimize_seconds")
+    counter = REGISTRY.get("argos_room_usage_optimizer_assignments_total")
+    calls_before, assignments_before = histogram.count, counter.value
+
+    RoomUsageOptimizer().optimize(
+        [Room("R1", capacity=50, base_energy_cost=10.0)],
+        [ClassRequest("SEC-1", 40, "MON-09"), ClassRequest("SEC-2", 20, "MON-10")],
+    )
+
+    assert histogram.count == calls_before + 1
+    assert counter.value == assignments_before + 2
+
+
+def test_predictor_records_latency_when_enabled(enrollment_csv):
+    histogram = REGISTRY.get("argos_enrollment_predictor_predict_seconds")
+    predictor = EnrollmentPredictor(EnrollmentPredictorConfig(record_metrics=True))
+    predictor.train(enrollment_csv)
+    calls_before = histogram.count
+
+    prob = predictor.predict(FEATURES)
+
+    assert 0.0 <= prob <= 1.0
+    assert histogram.count == calls_before + 1
+
+
+def test_predictor_skips_metrics_by_default(enrollment_csv):
+    histogram = REGISTRY.get("argos_enrollment_predictor_predict_seconds")
+    predictor = EnrollmentPredictor()
+    predictor.train(enrollment_csv)
+    calls_before = histogram.count
+
+    predictor.predict(FEATURES)
+
+    assert histogram.count == calls_before